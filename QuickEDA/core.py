@@ -1,17 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 from QuickEDA.plotting_manager import PlottingManager
-from .stats import univariate_stats, split_univariate_stats, bivariate_stats, calculate_regression_stats, check_heteroscedasticity, calculate_group_stats, prepare_multivariate_data, calculate_vif, fit_linear_model, get_model_metrics, get_model_coefficients, stepwise_regression
+from .stats import univariate_stats, univariate_stats_pl, split_sorted_univariate_stats, frame_fingerprint, same_fingerprint, bivariate_stats, calculate_regression_stats, check_heteroscedasticity, calculate_group_stats, prepare_multivariate_data, calculate_vif, fit_linear_model, get_model_metrics, get_model_coefficients, stepwise_regression
 # from .preprocessing import clean_data
 
 
 class DataAnalyzer:
     def __init__(self, df):
         self.df = df
+        self.backend = 'pandas'
         self.plotter = PlottingManager()
+        self._prepared = None
+        self._prepared_key = None
+
+    def set_df(self, df):
+        """Replace the analyzed DataFrame and drop results cached for the previous one"""
+        self.df = df
+        self._prepared = self._prepared_key = None
+        return self
 
     def set_backend(self, backend):
+        """Set the univariate stats backend ('pandas' or 'polars')"""
         self.backend = backend
 
-    def univariate_analysis(self, split_results: bool = False, sort_by: str = "skew"):
+    def _prepared_data(self, refresh: bool = False):
+        """Return prepare_multivariate_data(self.df), reusing it while self.df is unchanged (see frame_fingerprint)"""
+        fingerprint = frame_fingerprint(self.df)
+        cached = self._prepared_key
+        if refresh or cached is None or cached[0] is not self.df or not same_fingerprint(cached[1], fingerprint):
+            self._prepared = prepare_multivariate_data(self.df)
+            self._prepared_key = (self.df, fingerprint)
+        return self._prepared
+
+    def univariate_analysis(self, split_results: bool = False, sort_by: str = "skew", refresh: bool = False):
         """
         Perform complete univariate analysis on the dataset.
         
@@ -21,6 +42,10 @@ class DataAnalyzer:
             If True, returns results separated into numeric and categorical columns
         sort_by : str, optional (default="skew")
             Metric to sort results by (options: 'skew', 'kurt', 'missing', etc.)
+        refresh : bool, optional (default=False)
+            Recompute instead of reusing the stats cached for self.df. Results are
+            reused while the DataFrame's columns are unchanged; in-place edits such
+            as df.loc[i, col] = v are not detected and need refresh=True
             
         Returns:
         --------
@@ -35,18 +60,37 @@ class DataAnalyzer:
         >>> combined = analyzer.univariate_analysis()
         >>> # Get split results
         >>> split = analyzer.univariate_analysis(split_results=True)
+        >>> # After editing analyzer.df in place
+        >>> stats = analyzer.univariate_analysis(refresh=True)
         """
+        # Cached per DataFrame in the stats module; a new sort_by only re-sorts
+        compute = univariate_stats_pl if self.backend == 'polars' else univariate_stats
+        stats = compute(self.df, sort_by, refresh)
+        
         if split_results:
-            return split_univariate_stats(self.df)
-        return univariate_stats(self.df, sort_by)
+            return split_sorted_univariate_stats(stats)
+        return stats
+
+    def _feature_stats(self, feature: str, label: str, test_type: str):
+        """Statistics shown alongside a single feature's bivariate plot"""
+        if test_type == 'pearson_r':
+            stats = calculate_regression_stats(self.df[feature], self.df[label])
+            het_test = check_heteroscedasticity(
+                self.df[[feature, label]], 
+                feature, 
+                label
+            )
+            return stats, het_test
+        return calculate_group_stats(self.df, feature, label)
 
-    def bivariate_analysis(self, label: str, plot_backend: str = 'seaborn'):
+    def bivariate_analysis(self, label: str, plot_backend: str = 'seaborn', n_jobs: Optional[int] = None):
         """
         Perform comprehensive bivariate analysis between each feature and the target.
         
         Args:
             label: Target variable name for analysis
             plot_backend: Visualization library to use ('seaborn' or 'plotly')
+            n_jobs: Worker threads for the per-feature statistics (None picks a default, 1 runs serially)
             
         Returns:
             Tuple of:
@@ -59,41 +103,43 @@ class DataAnalyzer:
             >>> stats, plots = analyzer.bivariate_analysis('price', plot_backend='plotly')
         """
         self.plotter.set_backend(plot_backend)
-        results = {}
         plots = {}
         
         stats_df = bivariate_stats(self.df, label)
+        tested = stats_df[stats_df['test_type'].isin(['pearson_r', 'anova_f'])]
+        features = tested['feature'].tolist()
+        test_types = tested['test_type'].tolist()
+        
+        # Feature statistics are independent of each other and run concurrently;
+        # plots are drawn afterwards on this thread since plotting backends aren't thread-safe
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            feature_stats = list(executor.map(
+                self._feature_stats, features, [label] * len(features), test_types
+            ))
         
-        for _, row in stats_df.iterrows():
-            feature = row['feature']
-            if row['test_type'] == 'pearson_r':
+        for feature, test_type, result in zip(features, test_types, feature_stats):
+            if test_type == 'pearson_r':
                 # Generate scatter plot for numeric features
-                stats = calculate_regression_stats(self.df[feature], self.df[label])
-                het_test = check_heteroscedasticity(
-                    self.df[[feature, label]], 
-                    feature, 
-                    label
-                )
+                stats, het_test = result
                 plots[feature] = self.plotter.scatter(
                     self.df[feature], 
                     self.df[label],
                     stats=stats,
                     heteroscedasticity=het_test
                 )
-            elif row['test_type'] == 'anova_f':
+            else:
                 # Generate bar plot for categorical features
-                stats = calculate_group_stats(self.df, feature, label)
                 plots[feature] = self.plotter.bar_chart(
                     self.df, 
                     feature, 
                     label,
-                    anova_results=stats['anova'],
-                    pairwise_tests=stats['pairwise_tests']
+                    anova_results=result['anova'],
+                    pairwise_tests=result['pairwise_tests']
                 )
         
         return stats_df, plots
 
-    def multivariate_analysis(self, target: str, method: str = 'full', min_features: int = 2):
+    def multivariate_analysis(self, target: str, method: str = 'full', min_features: int = 2, refresh: bool = False):
         """
         Perform multivariate analysis on the dataset.
         
@@ -101,6 +147,10 @@ class DataAnalyzer:
             target: Name of the target variable
             method: Analysis type ('full', 'vif', or 'stepwise')
             min_features: Minimum features to keep (for stepwise)
+            refresh: Re-prepare the data instead of reusing the encoded and scaled
+                copy of self.df kept from earlier calls. It is reused while the
+                DataFrame's columns are unchanged; in-place edits such as
+                df.loc[i, col] = v are not detected and need refresh=True
             
         Returns:
             Analysis results (format varies by method)
@@ -115,11 +165,14 @@ class DataAnalyzer:
             >>> # Stepwise feature selection
             >>> stepwise = analyzer.multivariate_analysis('price', method='stepwise', min_features=3)
         """
-        prepared_df = prepare_multivariate_data(self.df)
+        prepared_df = self._prepared_data(refresh)
         
         if method == 'vif':
             return calculate_vif(prepared_df, target)
         
+        if method == 'stepwise':
+            return stepwise_regression(self.df, target, min_features, prepared_df=prepared_df)
+        
         model = fit_linear_model(prepared_df, target)
         
         if method == 'full':
@@ -128,9 +181,6 @@ class DataAnalyzer:
                 'metrics': get_model_metrics(model, prepared_df[target])
             }
         
-        if method == 'stepwise':
-            return stepwise_regression(self.df, target, min_features)
-        
         raise ValueError("Method must be 'full', 'vif', or 'stepwise'")
 
 
@@ -0,0 +1,125 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba is optional; callers fall back to pandas
+    numba = None
+
+HAS_NUMBA = numba is not None
+column_stats = None
+
+
+if HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _column_moments(col: np.ndarray):
+        """
+        Count, mean, std, skew and kurt of a 1D float64 array in one pass, skipping NaNs.
+
+        Central moments are accumulated with the Welford/Terriberry update and turned
+        into pandas' ddof=1 std and bias-corrected skew/kurt. As in pandas, a column
+        holding ±inf has the mean of its plain sum and NaN higher moments.
+        """
+        n = 0
+        total = 0.0
+        mean = 0.0
+        m2 = 0.0
+        m3 = 0.0
+        m4 = 0.0
+        max_abs = 0.0
+        for x in col:
+            if np.isnan(x):
+                continue
+            n += 1
+            total += x
+            delta = x - mean
+            delta_n = delta / n
+            delta_n2 = delta_n * delta_n
+            term1 = delta * delta_n * (n - 1)
+            mean += delta_n
+            m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+            m3 += term1 * delta_n * (n - 2) - 3 * delta_n * m2
+            m2 += term1
+            max_abs = max(max_abs, abs(x))
+
+        std = skew = kurt = np.nan
+        if n == 0:
+            mean = np.nan
+        if np.isinf(max_abs):
+            return n, total / n, std, skew, kurt
+        if n > 1:
+            std = np.sqrt(m2 / (n - 1))
+
+        # Same floating point tolerance pandas uses to treat a column as constant
+        constant = m2 <= (np.finfo(np.float64).eps * max_abs) ** 2 * n
+        if n > 2:
+            skew = 0.0 if constant else n * (n - 1) ** 0.5 / (n - 2) * m3 / m2 ** 1.5
+        if n > 3:
+            kurt = 0.0 if constant else (
+                n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 * m2)
+                - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+            )
+        return n, mean, std, skew, kurt
+
+    @numba.njit(cache=True)
+    def _lerp(a: float, b: float, t: float) -> float:
+        """numpy's quantile interpolation between neighbours a <= b, including its NaNs next to ±inf"""
+        if t >= 0.5:
+            return b - (b - a) * (1 - t)
+        return a + (b - a) * t
+
+    @numba.njit(nogil=True, cache=True)
+    def column_stats(values: np.ndarray, out: np.ndarray) -> None:
+        """
+        Univariate statistics for every column of a 2D float64 array, skipping NaNs.
+
+        Each column is scanned once for its moments and sorted once for its
+        quartiles, distinct-value count and mode. Results are written straight
+        into out, so callers can fill one preallocated array chunk by chunk.
+        Compiled without parallel=True: numba's default TBB threading layer
+        hangs interpreter exit when a parallel kernel is first launched from a
+        thread other than the main one.
+
+        Args:
+            values: (n_rows, n_cols) float64 array, ideally Fortran-ordered
+            out: (n_cols, 12) float64 array receiving the columns
+                min, 25%, median, 75%, max, mean, std, skew, kurt, unique, mode, count
+                (matching pandas' quantile interpolation, bias-corrected skew/kurt, nunique
+                and the smallest of tied modes as in Series.mode()[0])
+        """
+        for j in range(values.shape[1]):
+            col = values[:, j]
+            n, out[j, 5], out[j, 6], out[j, 7], out[j, 8] = _column_moments(col)
+            out[j, 11] = n
+            if n == 0:
+                out[j, 0:5] = np.nan
+                out[j, 9] = 0
+                out[j, 10] = np.nan
+                continue
+
+            finite = np.sort(col[~np.isnan(col)])
+            out[j, 0] = finite[0]
+            for q in (1, 3):
+                pos = 0.25 * q * (n - 1)
+                lo = int(pos)
+                out[j, q] = _lerp(finite[lo], finite[min(lo + 1, n - 1)], pos - lo)
+            # Series.median() averages the middle pair instead of interpolating
+            mid = (n - 1) // 2
+            out[j, 2] = finite[mid] if n % 2 else (finite[mid] + finite[mid + 1]) / 2
+            out[j, 4] = finite[n - 1]
+
+            # Equal values are adjacent once sorted: count the runs and keep the
+            # first longest one, i.e. the smallest mode
+            unique = 1
+            run = best = 1
+            mode = finite[0]
+            for i in range(1, n):
+                if finite[i] != finite[i - 1]:
+                    unique += 1
+                    run = 1
+                else:
+                    run += 1
+                    if run > best:
+                        best = run
+                        mode = finite[i]
+            out[j, 9] = unique
+            out[j, 10] = mode
@@ -1,29 +1,39 @@
 class PlottingManager:
     """Ultra-simple plotting backend switcher"""
-    
+
     def __init__(self):
         self.backend = 'seaborn'  # default
-    
+        self._scatter_fn = None  # bound to the backend on first use
+        self._bar_fn = None
+
     def set_backend(self, backend_name):
         """Set backend (seaborn|plotly)"""
         if backend_name not in ['seaborn', 'plotly']:
             raise ValueError("Only 'seaborn' or 'plotly' supported")
+        if backend_name == self.backend:
+            return
         self.backend = backend_name
-    
-    def scatter(self, x, y, **kwargs):
-        """Create scatter plot with current backend"""
+        self._bind_backend()
+
+    def _bind_backend(self):
+        """Import the current backend once and cache its plotting functions"""
         if self.backend == 'seaborn':
             import seaborn as sns
-            return sns.jointplot(x=x, y=y, kind='reg', **kwargs)
+            self._scatter_fn = lambda x, y, **kwargs: sns.jointplot(x=x, y=y, kind='reg', **kwargs)
+            self._bar_fn = lambda x, y, **kwargs: sns.barplot(x=x, y=y, **kwargs)
         else:
             import plotly.express as px
-            return px.scatter(x=x, y=y, trendline="ols", **kwargs)
-    
+            self._scatter_fn = lambda x, y, **kwargs: px.scatter(x=x, y=y, trendline="ols", **kwargs)
+            self._bar_fn = lambda x, y, **kwargs: px.bar(x=x, y=y, **kwargs)
+
+    def scatter(self, x, y, **kwargs):
+        """Create scatter plot with current backend"""
+        if self._scatter_fn is None:
+            self._bind_backend()
+        return self._scatter_fn(x, y, **kwargs)
+
     def bar_chart(self, x, y, **kwargs):
         """Create bar chart with current backend"""
-        if self.backend == 'seaborn':
-            import seaborn as sns
-            return sns.barplot(x=x, y=y, **kwargs)
-        else:
-            import plotly.express as px
-            return px.bar(x=x, y=y, **kwargs)
+        if self._bar_fn is None:
+            self._bind_backend()
+        return self._bar_fn(x, y, **kwargs)
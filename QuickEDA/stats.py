@@ -1,18 +1,40 @@
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Literal
 import pandas as pd
 import numpy as np
-from scipy import stats
-from statsmodels.stats.diagnostic import het_breuschpagan, het_white
+from scipy import stats, linalg
+from statsmodels.stats.diagnostic import het_breuschpagan
 import statsmodels.api as sm
-from statsmodels.formula.api import ols
-from sklearn.linear_model import LinearRegression
-from sklearn import preprocessing
 from typing import List, Tuple, Dict
+from .kernels import HAS_NUMBA, column_stats
+
+
+STATS_COLUMNS = [
+    'count', 'missing', 'unique', 'dtype', 
+    'min', '25%', 'median', '75%', 'max', 
+    'mean', 'mode', 'std', 'skew', 'kurt', 
+    'numeric'
+]
+
+NUMERIC_STATS = ['min', '25%', 'median', '75%', 'max', 'mean', 'std', 'skew', 'kurt']
+
+# Computed separately for the numeric and the non-numeric columns, then stitched together
+SPLIT_STATS = NUMERIC_STATS + ['unique', 'mode', 'count']
+
+# Numeric columns are processed in chunks of this many columns
+CHUNK_COLUMNS = 64
+
+# Smaller numeric chunks use the numpy path: it is as fast there, and never
+# pays for loading (or, on a fresh install, compiling) the numba kernel
+NUMBA_MIN_VALUES = 1_000_000
 
 
 def univariate_stats(
     df: pd.DataFrame,
-    sort_by: Union[Literal["skew", "kurt", "missing", "unique", "std"], str] = "skew"
+    sort_by: Union[Literal["skew", "kurt", "missing", "unique", "std"], str] = "skew",
+    refresh: bool = False
 ) -> pd.DataFrame:
     """
     Calculate comprehensive univariate statistics for all columns in a DataFrame.
@@ -23,69 +45,536 @@ def univariate_stats(
         Input dataframe to analyze
     sort_by : str, optional (default="skew")
         Column to sort the results by (options: 'skew', 'kurt', 'missing', 'unique', 'std')
+    refresh : bool, optional (default=False)
+        Recompute even if stats are cached for df
         
     Returns:
     --------
     pd.DataFrame
-        Dataframe containing univariate statistics for each column
+        Dataframe containing univariate statistics for each column. Numeric-only
+        statistics are NaN for non-numeric columns (use .fillna('-') for display)
+    
+    Results are cached per DataFrame object while it is alive and unchanged
+    (see frame_fingerprint), so repeated calls only re-sort. Writes into existing
+    column arrays, such as df.loc[i, col] = v, are not detected; pass refresh=True
+    after editing df in place.
     """
-    STATS_COLUMNS = [
-        'count', 'missing', 'unique', 'dtype', 
-        'min', '25%', 'median', '75%', 'max', 
-        'mean', 'mode', 'std', 'skew', 'kurt', 
-        'numeric'
-    ]
+    return sort_univariate_stats(_cached_univariate_stats(df, _compute_univariate_stats, refresh=refresh), sort_by)
+
+
+def _compute_univariate_stats(df: pd.DataFrame, numeric_stats=None) -> pd.DataFrame:
+    """Unsorted univariate_stats result, with numeric_stats computing the numeric columns' stats"""
+    is_numeric = _numeric_mask(df)
+    num_df = df.loc[:, is_numeric]
+    cat_df = df.loc[:, ~is_numeric]
+
+    # The two halves are independent and spend their time in numpy/pandas/numba
+    # code that releases the GIL, so the categorical half runs on a worker thread
+    # while the numeric half runs on this one
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        cat_future = executor.submit(_compute_cat_stats, cat_df)
+        num_stats = _integer_column_stats(num_df, (numeric_stats or _compute_numeric_stats)(num_df))
+        cat_stats = cat_future.result()
+
+    return _assemble_univariate_stats(df, num_stats, cat_stats)
+
+
+def _numeric_mask(df: pd.DataFrame, include_bool: bool = False) -> np.ndarray:
+    """Boolean array marking df's numeric columns (timedelta excluded), from one dtype selection"""
+    include = [np.number, 'bool'] if include_bool else np.number
+    return df.columns.isin(df.select_dtypes(include=include, exclude='timedelta').columns)
+
+
+def _compute_numeric_stats(num_df: pd.DataFrame) -> pd.DataFrame:
+    """SPLIT_STATS for each column of an all-numeric frame"""
+    if not num_df.shape[1]:
+        return pd.DataFrame(columns=SPLIT_STATS)
+
+    # Every chunk writes its rows straight into one preallocated result array
+    out = np.empty((num_df.shape[1], len(SPLIT_STATS)))
+    for i, values in enumerate(_numeric_chunks(num_df)):
+        _numeric_block_stats(values, out[i * CHUNK_COLUMNS:(i + 1) * CHUNK_COLUMNS])
+    return pd.DataFrame(out, index=num_df.columns, columns=SPLIT_STATS).astype({'unique': np.int64, 'count': np.int64})
+
+
+def _integer_column_stats(num_df: pd.DataFrame, num_stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    Report 'unique' and 'mode' of num_df's integer columns in their own dtype.
     
-    output_df = pd.DataFrame(columns=STATS_COLUMNS)
+    The numeric backends work on a float64 copy, which holds integers exactly only
+    up to 2**53: beyond that, distinct values can collapse, so such columns are
+    recounted from their original values. Other modes are cast back to the column's type.
+    """
+    is_integer = np.array([pd.api.types.is_integer_dtype(dtype) for dtype in num_df.dtypes], dtype=bool)
+    if not is_integer.any():
+        return num_stats
+
+    unique = num_stats['unique'].to_numpy(copy=True)
+    modes = num_stats['mode'].to_numpy(dtype=object)
+    # min/max of the float64 copy reach 2**53 whenever an original value exceeds it
+    inexact = np.fmax(num_stats['min'].abs(), num_stats['max'].abs()).to_numpy() >= 2.0**53
+    for i in np.flatnonzero(is_integer):
+        col = num_df.iloc[:, i]
+        if inexact[i]:
+            unique[i] = col.nunique()
+            modes[i] = _mode(col)
+        elif not np.isnan(modes[i]):
+            modes[i] = np.dtype(getattr(col.dtype, 'numpy_dtype', col.dtype)).type(modes[i])
+    return num_stats.assign(unique=unique, mode=modes)
+
+
+def _numeric_chunks(num_df: pd.DataFrame):
+    """
+    Yield num_df as Fortran-ordered float64 arrays of CHUNK_COLUMNS columns each.
+    
+    Converting chunk by chunk keeps the float64 copy and the per-chunk
+    temporaries small on very wide frames.
+    """
+    for start in range(0, num_df.shape[1], CHUNK_COLUMNS):
+        yield np.asfortranarray(
+            num_df.iloc[:, start:start + CHUNK_COLUMNS].to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+
+
+def _numeric_block_stats(values: np.ndarray, out: np.ndarray) -> None:
+    """
+    Write SPLIT_STATS of every column of a 2D float64 array into the (n_cols, len(SPLIT_STATS)) array out.
+    
+    A compiled single pass per column when numba is available and the block has at
+    least NUMBA_MIN_VALUES values, otherwise block-wide numpy operations: one sort
+    for order statistics and modes, reductions for the moments.
+    """
+    if HAS_NUMBA and values.size >= NUMBA_MIN_VALUES:
+        # The kernel's sorted columns also yield distinct-value counts and modes
+        column_stats(values, out)
+        return
+    order_stats = _sorted_block_stats(values)  # min..max, unique, mode
+    moments = _block_moments(values)  # count, mean, std, skew, kurt
+    out[:, :5] = order_stats[:5].T
+    out[:, 5:9] = moments[1:].T
+    out[:, 9:11] = order_stats[5:].T
+    out[:, 11] = moments[0]
+
+
+def _sorted_block_stats(values: np.ndarray) -> np.ndarray:
+    """
+    Min, quartiles, max, unique and mode of every column of a 2D float64 array, skipping NaNs.
     
-    for col in df.columns:
-        col_series = df[col]
-        is_numeric = pd.api.types.is_numeric_dtype(col_series)
+    Same results as the numba kernel, from one np.sort of the whole block (NaNs
+    sort last) and index arithmetic instead of a loop over columns.
+    
+    Returns:
+        (7, n_cols) array
+    """
+    n_rows, n_cols = values.shape
+    ordered = np.sort(values, axis=0)
+    n = np.count_nonzero(~np.isnan(ordered), axis=0)
+    out = np.full((7, n_cols), np.nan)
+    out[5] = 0
+    cols = np.flatnonzero(n)
+    if not cols.size:
+        return out
+
+    last = n[cols] - 1
+    out[0, cols] = ordered[0, cols]
+    out[4, cols] = ordered[last, cols]
+    for row, q in [(1, 0.25), (3, 0.75)]:
+        pos = q * last
+        lo = pos.astype(np.intp)
+        out[row, cols] = _lerp(ordered[lo, cols], ordered[np.minimum(lo + 1, last), cols], pos - lo)
+    # Series.median() averages the middle pair instead of interpolating
+    mid = last // 2
+    pair_mean = (ordered[mid, cols] + ordered[np.minimum(mid + 1, last), cols]) / 2
+    out[2, cols] = np.where(n[cols] % 2, ordered[mid, cols], pair_mean)
+
+    # Equal values are adjacent in each sorted column: a run starts wherever the value changes
+    start = np.arange(n_rows)[:, None] < n
+    start[1:] &= ordered[1:] != ordered[:-1]
+    run_cols, run_rows = np.nonzero(start.T)  # grouped by column, ascending values within it
+    out[5] = np.bincount(run_cols, minlength=n_cols)
+
+    # A run ends where the next run of its column starts, or after the column's last value
+    col_ends = np.append(run_cols[1:] != run_cols[:-1], True)
+    lengths = np.where(col_ends, n[run_cols], np.append(run_rows[1:], 0)) - run_rows
+    # Stable sort: the first of the longest runs, i.e. the smallest mode, leads each column
+    order = np.lexsort((-lengths, run_cols))
+    first = order[np.append(True, run_cols[order][1:] != run_cols[order][:-1])]
+    out[6, run_cols[first]] = ordered[run_rows[first], run_cols[first]]
+    return out
+
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    numpy's quantile interpolation between sorted neighbours a <= b, as used by Series.quantile.
+    
+    Interpolates from b when t >= 0.5, and gives NaN next to ±inf even at t == 0.
+    """
+    with np.errstate(invalid='ignore'):
+        diff = b - a
+        return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
+
+
+def _block_moments(values: np.ndarray) -> np.ndarray:
+    """
+    Count, mean, std, skew and kurt of every column of a 2D float64 array, skipping NaNs.
+    
+    Same conventions as the numba kernel (pandas' ddof=1 std, bias-corrected
+    skew/kurt, 0 for constant columns), as whole-array reductions along axis 0.
+    
+    Returns:
+        (5, n_cols) array
+    """
+    with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+        warnings.simplefilter('ignore', RuntimeWarning)  # all-NaN columns
+        missing = np.isnan(values)
+        n = values.shape[0] - np.count_nonzero(missing, axis=0).astype(np.float64)
+        mean = np.nanmean(values, axis=0)
+        # Only missing values are zeroed: NaNs that inf arithmetic produces
+        # (e.g. inf - inf) must propagate, as they do in pandas
+        centered = values - mean
+        centered[missing] = 0
+        # Higher powers are built in place from the same two buffers
+        power = centered * centered
+        m2 = power.sum(axis=0)
+        centered *= power
+        m3 = centered.sum(axis=0)
+        power *= power
+        m4 = power.sum(axis=0)
+        max_abs = np.abs(np.where(missing, 0, values)).max(axis=0, initial=0)
+
+        std = np.where(n > 1, np.sqrt(m2 / (n - 1)), np.nan)
+        skew = np.where(n > 2, n * np.sqrt(n - 1) / (n - 2) * m3 / m2 ** 1.5, np.nan)
+        kurt = np.where(
+            n > 3,
+            n * (n + 1) * (n - 1) * m4 / ((n - 2) * (n - 3) * m2 * m2) - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3)),
+            np.nan
+        )
+
+    # Same floating point tolerance pandas uses to treat a column as constant
+    constant = m2 <= (np.finfo(np.float64).eps * max_abs) ** 2 * n
+    skew[constant & (n > 2)] = 0.0
+    kurt[constant & (n > 3)] = 0.0
+    return np.vstack([n, mean, std, skew, kurt])
+
+
+def _compute_cat_stats(cat_df: pd.DataFrame) -> pd.DataFrame:
+    """'unique', 'mode' and 'count' for each column of a non-numeric frame"""
+    is_category = cat_df.columns.isin(cat_df.select_dtypes(include='category').columns)
+    other = cat_df.loc[:, ~is_category]
+    cat_stats = pd.DataFrame(
+        {'unique': other.nunique(), 'mode': _column_modes(other), 'count': other.count()}, index=other.columns
+    )
+    if not is_category.any():
+        return cat_stats
+
+    # Dictionary-encoded columns: everything follows from their integer codes, without hashing values
+    category_stats = pd.DataFrame(
+        [_category_stats(cat_df.iloc[:, i]) for i in np.flatnonzero(is_category)],
+        index=cat_df.columns[is_category],
+        columns=['unique', 'mode', 'count']
+    )
+    return pd.concat([s for s in (cat_stats, category_stats) if len(s)])
+
+
+def _category_stats(col: pd.Series) -> tuple:
+    """nunique(), mode()[0] and count() of a category column from one bincount of its codes"""
+    codes = col.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(col.cat.categories))
+    count = int(counts.sum())
+    if not count:
+        return 0, np.nan, 0
+    # argmax picks the first of tied categories, as Series.mode() orders them by category
+    return np.count_nonzero(counts), col.cat.categories[counts.argmax()], count
+
+
+def _column_modes(df: pd.DataFrame) -> pd.Series:
+    """Most frequent value of each column (see _mode)"""
+    return pd.Series([_mode(df.iloc[:, i]) for i in range(df.shape[1])], index=df.columns, dtype=object)
+
+
+def _mode(col: pd.Series):
+    """
+    Equivalent of col.mode()[0], NaN for a column without values.
+    
+    Takes the argmax of the unsorted value counts, so only tied values get sorted
+    to pick the smallest one, rather than every distinct value as in Series.mode().
+    """
+    counts = col.value_counts(sort=False)
+    if not len(counts):
+        return np.nan
+    top = counts.index[counts.to_numpy() == counts.to_numpy().max()]
+    if len(top) == 1:
+        return top[0]
+    try:
+        return top.sort_values()[0]
+    except TypeError:  # unorderable mixed-type values
+        return top[0]
+
+
+def univariate_stats_pl(
+    df: pd.DataFrame,
+    sort_by: Union[Literal["skew", "kurt", "missing", "unique", "std"], str] = "skew",
+    refresh: bool = False
+) -> pd.DataFrame:
+    """
+    Same as univariate_stats, but computes the numeric statistics with polars.
+    
+    Polars evaluates all numeric reductions in one multithreaded query. Requires
+    the optional polars dependency.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Input dataframe to analyze
+    sort_by : str, optional (default="skew")
+        Column to sort the results by (options: 'skew', 'kurt', 'missing', 'unique', 'std')
+    refresh : bool, optional (default=False)
+        Recompute even if stats are cached for df (see univariate_stats)
         
-        stats = {
-            'count': col_series.count(),
-            'missing': col_series.isnull().sum(),
-            'unique': col_series.nunique(),
-            'dtype': col_series.dtype,
-            'numeric': is_numeric
+    Returns:
+    --------
+    pd.DataFrame
+        Dataframe containing univariate statistics for each column
+    """
+    return sort_univariate_stats(
+        _cached_univariate_stats(
+            df, lambda df: _compute_univariate_stats(df, _compute_numeric_stats_pl), 'polars', refresh
+        ),
+        sort_by
+    )
+
+
+def _compute_numeric_stats_pl(num_df: pd.DataFrame) -> pd.DataFrame:
+    """_compute_numeric_stats evaluated as one polars query"""
+    import polars as pl
+
+    num_stats = pd.DataFrame(columns=SPLIT_STATS)
+
+    if num_df.shape[1]:
+        # Positional column names: polars requires unique string names
+        values = num_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        num = pl.from_numpy(values, schema=[str(i) for i in range(values.shape[1])], orient='row').fill_nan(None)
+        exprs = {
+            'min': pl.all().min(),
+            '25%|lower': pl.all().quantile(0.25, interpolation='lower'),
+            '25%|higher': pl.all().quantile(0.25, interpolation='higher'),
+            'median': pl.all().median(),
+            '75%|lower': pl.all().quantile(0.75, interpolation='lower'),
+            '75%|higher': pl.all().quantile(0.75, interpolation='higher'),
+            'max': pl.all().max(),
+            'mean': pl.all().mean(),
+            'std': pl.all().std(),
+            'skew': pl.all().skew(bias=False),
+            'kurt': pl.all().kurtosis(bias=False),
+            'count': pl.all().count(),
+            'unique': pl.all().drop_nulls().n_unique(),
+            'mode': pl.all().drop_nulls().mode().min(),
+            'n_inf': (pl.all() == np.inf).sum(),
         }
-        
-        if is_numeric:
-            stats.update({
-                'min': col_series.min(),
-                '25%': col_series.quantile(0.25),
-                'median': col_series.median(),
-                '75%': col_series.quantile(0.75),
-                'max': col_series.max(),
-                'mean': col_series.mean(),
-                'std': col_series.std(),
-                'skew': col_series.skew(),
-                'kurt': col_series.kurt(),
-                'mode': col_series.mode().values[0]
-            })
-        else:
-            stats.update({
-                'min': '-', '25%': '-', 'median': '-', '75%': '-', 'max': '-',
-                'mean': '-', 'std': '-', 'skew': '-', 'kurt': '-',
-                'mode': col_series.mode().values[0]
-            })
-        
-        output_df.loc[col] = stats
+        row = num.select([expr.name.suffix(f"|{name}") for name, expr in exprs.items()]).to_numpy()
+        num_stats = pd.DataFrame(
+            row.reshape(len(exprs), -1).T, index=num_df.columns, columns=list(exprs)
+        ).astype({'count': np.int64, 'unique': np.int64})
+        counts = num_stats['count']
+        # Quartiles are interpolated like pandas (see _lerp) between the lower and next sorted
+        # value. On an exact position polars' 'higher' is that value itself; the next one
+        # only matters, as NaN, when it is +inf
+        last = (counts - 1).to_numpy()
+        for q, name in [(0.25, '25%'), (0.75, '75%')]:
+            pos = q * last
+            t = pos - np.floor(pos)
+            lower, higher = num_stats[f'{name}|lower'].to_numpy(), num_stats[f'{name}|higher'].to_numpy()
+            next_is_inf = (pos < last) & (np.floor(pos) + 1 >= counts.to_numpy() - num_stats['n_inf'].to_numpy())
+            num_stats[name] = _lerp(lower, np.where((t == 0) & next_is_inf, np.inf, higher), t)
+        # pandas reports constant columns as 0 skew/kurt where polars gives NaN
+        constant = num_stats['std'] == 0
+        num_stats.loc[constant & (counts > 2), 'skew'] = 0.0
+        num_stats.loc[constant & (counts > 3), 'kurt'] = 0.0
+        num_stats = num_stats[SPLIT_STATS]
+
+    return num_stats
+
+
+# (id(df), backend) -> (weak reference to df, frame_fingerprint(df), unsorted stats);
+# entries are dropped as soon as their DataFrame is garbage collected
+_STATS_CACHE: Dict[tuple, tuple] = {}
+
+
+def frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Shape, columns and the arrays backing df, to tell whether a DataFrame object has changed.
     
-    return output_df.sort_values(
-        by=["numeric", sort_by], 
-        ascending=[False, sort_by != "missing"]
+    Assigning, replacing or filling columns swaps their arrays and changes the
+    fingerprint. Writes into existing arrays (e.g. df.loc[i, col] = v) do not.
+    The arrays are referenced weakly rather than by id, so a freed id can't be
+    mistaken for them and replaced columns aren't kept alive by the fingerprint.
+    """
+    return df.shape, tuple(df.columns), tuple(_weak_ref(arr) for arr in df._mgr.arrays)
+
+
+def _weak_ref(obj):
+    """Weak reference to obj, or obj itself if its type doesn't support them"""
+    try:
+        return weakref.ref(obj)
+    except TypeError:
+        return obj
+
+
+def _referent(ref):
+    """Object behind a _weak_ref result (None once it has been garbage collected)"""
+    return ref() if isinstance(ref, weakref.ref) else ref
+
+
+def same_fingerprint(a: tuple, b: tuple) -> bool:
+    """Whether two frame_fingerprint results match, comparing the (live) arrays by identity"""
+    return a[:2] == b[:2] and len(a[2]) == len(b[2]) and all(
+        _referent(x) is not None and _referent(x) is _referent(y) for x, y in zip(a[2], b[2])
     )
 
 
-def split_univariate_stats(df):
-    stats = univariate_stats(df)
+def _cached_univariate_stats(df: pd.DataFrame, compute, backend: str = 'pandas', refresh: bool = False) -> pd.DataFrame:
+    """Return compute(df), reusing the result cached for this DataFrame object and backend if it is unchanged"""
+    result = None if refresh else _cached_stats(df, backend)
+    if result is not None:
+        return result
+
+    result = compute(df)
+    key = (id(df), backend)
+    _STATS_CACHE[key] = (weakref.ref(df, lambda _: _STATS_CACHE.pop(key, None)), frame_fingerprint(df), result)
+    return result
+
+
+def _cached_stats(df: pd.DataFrame, backend: str = 'pandas'):
+    """Unsorted stats cached for this DataFrame object and backend, or None"""
+    entry = _STATS_CACHE.get((id(df), backend))
+    if entry is not None and entry[0]() is df and same_fingerprint(entry[1], frame_fingerprint(df)):
+        return entry[2]
+    return None
+
+
+def _assemble_univariate_stats(df: pd.DataFrame, num_stats: pd.DataFrame, cat_stats: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stitch the numeric and categorical SPLIT_STATS into the STATS_COLUMNS layout.
+    
+    Both halves carry their own non-missing counts, so no pass over df itself is needed.
+    """
+    column_stats = pd.concat([s for s in (num_stats, cat_stats) if len(s)] or [num_stats]).reindex(
+        index=df.columns, columns=SPLIT_STATS
+    )
+    count = column_stats['count'].astype(np.int64)
+
+    columns = {
+        'count': count,
+        'missing': len(df) - count,
+        'unique': column_stats['unique'],
+        'dtype': df.dtypes,
+        'mode': column_stats['mode'],
+        'numeric': df.columns.isin(num_stats.index),
+        **{stat: column_stats[stat] for stat in NUMERIC_STATS}  # NaN for non-numeric columns
+    }
+    return pd.DataFrame({name: columns[name] for name in STATS_COLUMNS}, index=df.columns)
+
+
+def sort_univariate_stats(output_df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
+    """Order univariate_stats output with numeric columns first, then by sort_by (descending for 'missing'), NaNs last"""
+    column = output_df[sort_by]
+    if not pd.api.types.is_numeric_dtype(column):
+        # e.g. 'mode', which mixes numbers with strings
+        column = pd.to_numeric(column, errors='coerce')
+    key = column.to_numpy(dtype=float)
+    if sort_by == "missing":
+        key = -key
+    order = np.lexsort((key, ~output_df['numeric'].to_numpy(dtype=bool)))
+    return output_df.iloc[order]
+
+
+def split_univariate_stats(df, sort_by: str = "skew"):
+    return split_sorted_univariate_stats(univariate_stats(df, sort_by))
+
+
+def split_sorted_univariate_stats(output_df: pd.DataFrame) -> dict:
+    """Split sort_univariate_stats output, which lists numeric columns first, into two positional slices"""
+    n_numeric = np.count_nonzero(output_df['numeric'].to_numpy())
     return {
-        'numeric': stats[stats['numeric']],
-        'categorical': stats[~stats['numeric']]
+        'numeric': output_df.iloc[:n_numeric],
+        'categorical': output_df.iloc[n_numeric:]
     }
 
 
+class UnivariateStats:
+    """
+    Lazy view of univariate_stats(df, sort_by) that computes rows on demand.
+    
+    view[column] computes the stats of that column alone. head(n) computes only
+    the sort_by key for every column and the full stats for the first n rows;
+    quantiles and modes of the remaining columns are never computed. Sort keys
+    other than 'count', 'missing', 'unique', 'mean', 'std', 'skew' and 'kurt'
+    need the full result, which to_frame() returns. Once univariate_stats(df)
+    has been cached, all of these read from it.
+    
+    Examples:
+    --------
+    >>> view = UnivariateStats(df, sort_by="skew")
+    >>> view.head(10)
+    >>> view['price']
+    """
+    
+    # Rows of _block_moments' output
+    _MOMENTS = {'count': 0, 'mean': 1, 'std': 2, 'skew': 3, 'kurt': 4}
+    
+    def __init__(self, df: pd.DataFrame, sort_by: str = "skew"):
+        self._df = df
+        self._sort_by = sort_by
+        self._rows = {}
+    
+    def __len__(self) -> int:
+        return self._df.shape[1]
+    
+    def __getitem__(self, column) -> pd.Series:
+        """Stats of a single column"""
+        cached = _cached_stats(self._df)
+        if cached is not None:
+            return cached.loc[column]
+        if column not in self._rows:
+            self._rows[column] = _compute_univariate_stats(self._df.loc[:, [column]]).iloc[0]
+        return self._rows[column]
+    
+    def head(self, n: int = 5) -> pd.DataFrame:
+        """First n rows of univariate_stats(df, sort_by), computing full stats only for those columns"""
+        cached = _cached_stats(self._df)
+        if cached is not None:
+            return sort_univariate_stats(cached, self._sort_by).head(n)
+        keys = self._sort_keys()
+        if keys is None:
+            return self.to_frame().head(n)
+        top = sort_univariate_stats(keys, self._sort_by).index[:n]
+        return _compute_univariate_stats(self._df.loc[:, top])
+    
+    def to_frame(self) -> pd.DataFrame:
+        """The full univariate_stats(df, sort_by) result"""
+        return univariate_stats(self._df, self._sort_by)
+    
+    def _sort_keys(self):
+        """'numeric' and sort_by for every column, or None if sort_by needs the full stats"""
+        df = self._df
+        is_numeric = _numeric_mask(df)
+        if self._sort_by in ('count', 'missing'):
+            key = df.count()
+            if self._sort_by == 'missing':
+                key = len(df) - key
+        elif self._sort_by == 'unique':
+            key = df.nunique()
+        elif self._sort_by in self._MOMENTS:
+            key = pd.Series(np.nan, index=df.columns)
+            num_df = df.loc[:, is_numeric]
+            if num_df.shape[1]:
+                moments = np.hstack([_block_moments(values) for values in _numeric_chunks(num_df)])
+                key[is_numeric] = moments[self._MOMENTS[self._sort_by]]
+        else:
+            return None
+        return pd.DataFrame({self._sort_by: key.to_numpy(), 'numeric': is_numeric}, index=df.columns)
+
+
 def check_heteroscedasticity(df: pd.DataFrame, feature: str, label: str) -> pd.DataFrame:
     """
     Check for heteroscedasticity using Breusch-Pagan and White tests.
@@ -98,19 +587,29 @@ def check_heteroscedasticity(df: pd.DataFrame, feature: str, label: str) -> pd.D
     Returns:
         DataFrame with test results
     """
-    model = ols(formula=f"{label} ~ {feature}", data=df).fit()
+    x = df[feature].to_numpy(dtype=float)
+    y = df[label].to_numpy(dtype=float)
+    model = sm.OLS(y, sm.add_constant(x[:, None], has_constant='add'), missing='drop').fit()
+    exog = model.model.exog
     output_df = pd.DataFrame(columns=['LM stat', 'LM p-value', 'F-stat', 'F p-value'])
     
     # Breusch-Pagan test
-    bp_test = het_breuschpagan(model.resid, model.model.exog)
+    bp_test = het_breuschpagan(model.resid, exog)
     output_df.loc['Breusch-Pagan'] = bp_test
     
-    # White test (may fail in some cases)
-    try:
-        white_test = het_white(model.resid, model.model.exog)
-        output_df.loc['White'] = white_test
-    except Exception as e:
-        print(f"Unable to calculate White test: {str(e)}")
+    # White test, skipped when there are too few observations for its auxiliary
+    # regression. With a single regressor that design is just [1, x, x^2], so
+    # build it directly instead of via het_white
+    n, k = exog.shape
+    if n < max(30, 3*k*(k + 1)//2):
+        print(f"Unable to calculate White test: not enough observations (n={n})")
+    else:
+        try:
+            white_exog = np.column_stack([exog, exog[:, 1]**2])
+            white_test = het_breuschpagan(model.resid, white_exog)
+            output_df.loc['White'] = white_test
+        except np.linalg.LinAlgError as e:
+            print(f"Unable to calculate White test: {str(e)}")
     
     return output_df.round(3)
 
@@ -125,16 +624,39 @@ def calculate_regression_stats(feature: pd.Series, label: pd.Series) -> dict:
     Returns:
         Dictionary of regression statistics
     """
-    m, b, r, p, _ = stats.linregress(feature, label)
+    x = feature.to_numpy(dtype=float)
+    y = label.to_numpy(dtype=float)
+    n = len(x)
+    
+    # Closed-form least squares; the centred values are reused for the skews
+    dx = x - x.mean()
+    dy = y - y.mean()
+    sxx, syy, sxy = dx @ dx, dy @ dy, dx @ dy
+    m = sxy / sxx
+    b = y.mean() - m * x.mean()
+    r = np.clip(sxy / np.sqrt(sxx * syy), -1, 1)
+    with np.errstate(divide='ignore'):
+        t = r * np.sqrt((n - 2) / (1 - r * r))
+    p = 2 * stats.t.sf(np.abs(t), n - 2)
+    
     return {
         'slope': round(m, 3),
         'intercept': round(b, 3),
         'r_squared': round(r**2, 3),
         'p_value': round(p, 3),
-        'feature_skew': round(feature.skew(), 3),
-        'label_skew': round(label.skew(), 3)
+        'feature_skew': round(_skew(dx, sxx), 3),
+        'label_skew': round(_skew(dy, syy), 3)
     }
 
+def _skew(centered: np.ndarray, sum_sq: float) -> float:
+    """Bias-corrected sample skewness (as pandas computes it) from centred values and their sum of squares"""
+    n = len(centered)
+    if n < 3:
+        return np.nan
+    if sum_sq == 0:
+        return 0.0
+    return n * np.sqrt(n - 1) / (n - 2) * np.sum(centered**3) / sum_sq**1.5
+
 def calculate_group_stats(df: pd.DataFrame, feature: str, label: str) -> dict:
     """
     Calculate ANOVA and pairwise t-tests between groups.
@@ -147,39 +669,62 @@ def calculate_group_stats(df: pd.DataFrame, feature: str, label: str) -> dict:
     Returns:
         Dictionary containing ANOVA and pairwise test results
     """
-    groups = df[feature].unique()
-    df_grouped = df.groupby(feature)
-    group_data = [df_grouped.get_group(g)[label] for g in groups]
+    # One grouping pass shared by the ANOVA and the pairwise tests
+    grouped = df.groupby(feature, sort=False)[label]
+    groups_data = {group: values.to_numpy() for group, values in grouped}
     
     # ANOVA
-    f_stat, p_value = stats.f_oneway(*group_data)
-    
-    # Pairwise t-tests
-    ttests = []
-    for i, group1 in enumerate(groups):
-        for j, group2 in enumerate(groups):
-            if j > i:
-                data1 = df[df[feature] == group1][label]
-                data2 = df[df[feature] == group2][label]
-                
-                if len(data1) < 2 or len(data2) < 2:
-                    print(f"{group1} (n={len(data1)}) vs {group2} (n={len(data2)}): Not enough samples")
-                else:
-                    t, p = stats.ttest_ind(data1, data2)
-                    ttests.append({
-                        'group1': group1,
-                        'group2': group2,
-                        't_stat': round(t, 3),
-                        'p_value': round(p, 3),
-                        'significant': p < (0.05/len(ttests)) if ttests else p < 0.05
-                    })
+    f_stat, p_value = stats.f_oneway(*groups_data.values())
+    
+    # Pairwise t-tests for every group pair at once, from per-group summaries
+    summary = grouped.agg(['mean', 'var', 'count'])
+    names = summary.index
+    means = summary['mean'].to_numpy()
+    stds = np.sqrt(summary['var'].to_numpy())
+    ns = summary['count'].to_numpy()
+    
+    i, j = np.triu_indices(len(summary), k=1)
+    enough = (ns[i] >= 2) & (ns[j] >= 2)
+    for a, b in zip(i[~enough], j[~enough]):
+        print(f"{names[a]} (n={ns[a]}) vs {names[b]} (n={ns[b]}): Not enough samples")
+    i, j = i[enough], j[enough]
+    
+    t, p = stats.ttest_ind_from_stats(means[i], stds[i], ns[i], means[j], stds[j], ns[j])
+    threshold = 0.05/len(i) if len(i) else 0.05
+    ttests = [
+        {
+            'group1': names[a],
+            'group2': names[b],
+            't_stat': round(t_ab, 3),
+            'p_value': round(p_ab, 3),
+            'significant': p_ab < threshold
+        }
+        for a, b, t_ab, p_ab in zip(i, j, t, p)
+    ]
     
     return {
         'anova': {'f_stat': round(f_stat, 3), 'p_value': round(p_value, 3)},
         'pairwise_tests': ttests,
-        'bonferroni_threshold': 0.05/len(ttests) if ttests else 0.05
+        'bonferroni_threshold': threshold
     }
 
+def _anova_fast(df: pd.DataFrame, feature: str, label: str) -> Tuple[float, float]:
+    """One-way ANOVA F statistic and p-value of label across feature's groups, from per-group summaries"""
+    summary = df.groupby(feature, sort=False)[label].agg(['count', 'mean', 'var'])
+    ns = summary['count'].to_numpy()
+    means = summary['mean'].to_numpy()
+    vars_ = summary['var'].fillna(0).to_numpy()  # single-observation groups add no within variance
+    
+    grand_mean = (ns * means).sum() / ns.sum()
+    ss_between = (ns * (means - grand_mean)**2).sum()
+    ss_within = ((ns - 1) * vars_).sum()
+    df_between = len(ns) - 1
+    df_within = ns.sum() - len(ns)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f_stat = (ss_between / df_between) / (ss_within / df_within)
+    return f_stat, stats.f.sf(f_stat, df_between, df_within)
+
 def bivariate_stats(df: pd.DataFrame, label: str) -> pd.DataFrame:
     """
     Calculate bivariate statistics between each feature and the target label.
@@ -191,46 +736,48 @@ def bivariate_stats(df: pd.DataFrame, label: str) -> pd.DataFrame:
     Returns:
         DataFrame with statistical test results for each feature
     """
-    results = []
+    is_feature = df.columns != label
+    testable = is_feature & ~df.isna().any(axis=0).to_numpy()
+    is_numeric = _numeric_mask(df, include_bool=True)
     
-    for col in df.columns:
-        if col == label:
-            continue
-            
-        if df[col].isnull().sum() > 0:
-            results.append({
-                'feature': col,
-                'test_type': None,
-                'statistic': None,
-                'p_value': "nulls"
-            })
-            continue
-            
-        if pd.api.types.is_numeric_dtype(df[col]):
-            # Pearson correlation for numeric features
-            r, p = stats.pearsonr(df[label], df[col])
-            results.append({
-                'feature': col,
-                'test_type': 'pearson_r',
-                'statistic': round(r, 3),
-                'p_value': round(p, 3)
-            })
-        else:
-            # ANOVA for categorical features
-            f_stat, p = calculate_group_stats(df[[col, label]], col, label)['anova'].values()
-            results.append({
-                'feature': col,
-                'test_type': 'anova_f',
-                'statistic': round(f_stat, 3),
-                'p_value': round(p, 3)
-            })
-    
-    output_df = pd.DataFrame(results)
-    return output_df.sort_values(
-        by=['statistic'], 
-        key=abs, 
-        ascending=False
-    ).reset_index(drop=True)
+    features = df.columns[is_feature].tolist()
+    numeric_cols = df.columns[testable & is_numeric].tolist()
+    categorical_cols = df.columns[testable & ~is_numeric].tolist()
+    
+    test_type = pd.Series(None, index=features, dtype=object)
+    statistic = pd.Series(np.nan, index=features)
+    p_value = pd.Series("nulls", index=features, dtype=object)
+    
+    if numeric_cols:
+        # Pearson correlation for all numeric features at once
+        X = df[numeric_cols].to_numpy(dtype=float)
+        y = df[label].to_numpy(dtype=float)
+        X = X - X.mean(axis=0)
+        y = y - y.mean()
+        r = np.clip((X.T @ y) / np.sqrt((X * X).sum(axis=0) * (y @ y)), -1, 1)
+        n = len(y)
+        with np.errstate(divide='ignore'):
+            t = r * np.sqrt((n - 2) / (1 - r * r))
+        test_type[numeric_cols] = 'pearson_r'
+        statistic[numeric_cols] = r.round(3)
+        p_value[numeric_cols] = (2 * stats.t.sf(np.abs(t), n - 2)).round(3)
+    
+    for col in categorical_cols:
+        # ANOVA for categorical features
+        f_stat, p = _anova_fast(df, col, label)
+        test_type[col] = 'anova_f'
+        statistic[col] = round(f_stat, 3)
+        p_value[col] = round(p, 3)
+    
+    output_df = pd.DataFrame({
+        'feature': features,
+        'test_type': test_type.to_numpy(),
+        'statistic': statistic.to_numpy(),
+        'p_value': p_value.to_numpy()
+    })
+    # Strongest effects first; NaN statistics (features with nulls) sort last
+    order = np.argsort(-np.abs(output_df['statistic'].to_numpy()), kind='stable')
+    return output_df.iloc[order].reset_index(drop=True)
 
 def prepare_multivariate_data(df: pd.DataFrame, numeric_only: bool = True) -> pd.DataFrame:
     """
@@ -245,16 +792,24 @@ def prepare_multivariate_data(df: pd.DataFrame, numeric_only: bool = True) -> pd
     Returns:
         Processed DataFrame ready for analysis
     """
-    # One-hot encode categoricals
-    for col in df.select_dtypes(exclude=np.number):
-        df = df.join(pd.get_dummies(df[col], prefix=col, drop_first=True))
+    # One-hot encode all categoricals in a single pass
+    categorical_cols = df.select_dtypes(exclude=np.number).columns
+    scaled_cols = df.select_dtypes(np.number).columns
+    df = pd.get_dummies(df, columns=categorical_cols, drop_first=True, dtype=np.int8)
     
     if numeric_only:
         df = df.select_dtypes(np.number)
     
-    # Normalization of data
-    scaler = preprocessing.MinMaxScaler()
-    return pd.DataFrame(scaler.fit_transform(df), columns=df.columns)
+    # Min-max normalization of the original numeric columns; int8 dummies are already 0/1
+    # Explicit copy: to_numpy() can return a read-only view of (or, without
+    # Copy-on-Write, a writable alias into) the caller's data
+    values = df[scaled_cols].to_numpy(dtype=float, copy=True)
+    values -= np.nanmin(values, axis=0)
+    span = np.nanmax(values, axis=0)
+    span[span == 0] = 1
+    values /= span
+    df[scaled_cols] = values
+    return df
 
 def calculate_vif(df: pd.DataFrame, target: str = None) -> pd.DataFrame:
     """
@@ -268,21 +823,68 @@ def calculate_vif(df: pd.DataFrame, target: str = None) -> pd.DataFrame:
         DataFrame with VIF and tolerance values
     """
     features = [col for col in df.columns if col != target]
-    vif_results = pd.DataFrame(index=features, columns=['VIF', 'tolerance'])
+    X = df[features].to_numpy(dtype=np.float64)
     
-    for col in features:
-        y = df[col]
-        X = df.drop(columns=[col])
-        
-        r_squared = LinearRegression().fit(X, y).score(X, y)
-        tolerance = 1 - r_squared
-        vif = 1 / tolerance if tolerance > 0 else np.inf
-        
-        vif_results.loc[col] = [vif, tolerance]
+    # VIF_i is the i-th diagonal entry of the inverse correlation matrix;
+    # constant columns have no defined correlation and are reported as infinite
+    vif = np.full(len(features), np.inf)
+    varying = np.nanstd(X, axis=0) > 0
+    if varying.any():
+        corr = np.atleast_2d(np.corrcoef(X[:, varying], rowvar=False))
+        # diag(inv(corr))_i = sum_k V_ik^2 / lambda_k. Perfect multicollinearity leaves
+        # eigenvalues that are zero up to rounding, on which inv() rarely raises and
+        # returns huge or negative VIFs instead: every column loading on them is infinite
+        eigvals, eigvecs = np.linalg.eigh(corr)
+        null = eigvals <= eigvals.max() * np.sqrt(np.finfo(float).eps)
+        inv_diag = (eigvecs[:, ~null] ** 2 / eigvals[~null]).sum(axis=1)
+        inv_diag[np.abs(eigvecs[:, null]).max(axis=1, initial=0) > 1e-8] = np.inf
+        vif[varying] = inv_diag
+    
+    vif_results = pd.DataFrame({'VIF': vif, 'tolerance': 1 / vif}, index=features)
     
     return vif_results.sort_values('VIF')
 
-def fit_linear_model(df: pd.DataFrame, target: str) -> sm.regression.linear_model.RegressionResultsWrapper:
+class LinearModelResults:
+    """
+    Ordinary least squares fit in which every reported quantity shares one SVD of the design matrix.
+    
+    Exposes the subset of the statsmodels results interface used in this module:
+    params, tvalues, pvalues, fittedvalues, rsquared and rsquared_adj.
+    Rank-deficient designs are handled like statsmodels' pinv solver.
+    """
+    
+    def __init__(self, X: pd.DataFrame, y: pd.Series):
+        A = X.to_numpy(dtype=float)
+        b = y.to_numpy(dtype=float)
+        n = len(b)
+        
+        U, sv, Vt = linalg.svd(A, full_matrices=False, check_finite=False)
+        keep = sv > 1e-15 * sv.max()
+        rank = int(keep.sum())
+        V_scaled = Vt[keep].T / sv[keep]  # V S^-1: pinv(A) = V S^-1 U'
+        
+        beta = V_scaled @ (U[:, keep].T @ b)
+        fitted = A @ beta
+        residuals = b - fitted
+        ssr = residuals @ residuals
+        df_resid = n - rank
+        
+        # cov(beta) = sigma^2 (A'A)^-1 = sigma^2 V S^-2 V'; an exactly determined fit
+        # (no residual degrees of freedom) has no error estimate, reported as NaN
+        if df_resid > 0:
+            bse = np.sqrt(ssr / df_resid * np.sum(V_scaled**2, axis=1))
+        else:
+            bse = np.full_like(beta, np.nan)
+        tvalues = beta / bse
+        
+        self.params = pd.Series(beta, index=X.columns)
+        self.tvalues = pd.Series(tvalues, index=X.columns)
+        self.pvalues = pd.Series(2 * stats.t.sf(np.abs(tvalues), df_resid), index=X.columns)
+        self.fittedvalues = pd.Series(fitted, index=X.index)
+        self.rsquared = 1 - ssr / np.sum((b - b.mean())**2)
+        self.rsquared_adj = 1 - (n - 1) / df_resid * (1 - self.rsquared) if df_resid > 0 else np.nan
+
+def fit_linear_model(df: pd.DataFrame, target: str) -> LinearModelResults:
     """
     Fit a multivariate linear regression model.
     
@@ -291,18 +893,18 @@ def fit_linear_model(df: pd.DataFrame, target: str) -> sm.regression.linear_mode
         target: Name of target variable
         
     Returns:
-        Statsmodels regression results object
+        Regression results with params, tvalues, pvalues, fittedvalues, rsquared and rsquared_adj
     """
     y = df[target]
     X = sm.add_constant(df.drop(columns=[target]))
-    return sm.OLS(y, X).fit()
+    return LinearModelResults(X, y)
 
 def get_model_coefficients(results) -> pd.DataFrame:
     """
     Extract and format model coefficients.
     
     Args:
-        results: Statsmodels regression results
+        results: Fitted model (LinearModelResults)
         
     Returns:
         DataFrame of coefficients with t-stats and p-values
@@ -333,7 +935,12 @@ def get_model_metrics(results, actual: pd.Series) -> Dict[str, float]:
         'mae': np.mean(np.abs(residuals))
     }
 
-def stepwise_regression(df: pd.DataFrame, target: str, min_features: int = 2) -> pd.DataFrame:
+def stepwise_regression(
+    df: pd.DataFrame,
+    target: str,
+    min_features: int = 2,
+    prepared_df: pd.DataFrame = None
+) -> pd.DataFrame:
     """
     Perform stepwise feature elimination.
     
@@ -341,32 +948,70 @@ def stepwise_regression(df: pd.DataFrame, target: str, min_features: int = 2) ->
         df: Original DataFrame
         target: Target variable name
         min_features: Minimum number of features to keep
+        prepared_df: Optional output of prepare_multivariate_data(df), reused if given
         
     Returns:
         DataFrame tracking model performance at each step
     """
-    prepared_df = prepare_multivariate_data(df)
-    results = []
+    if prepared_df is None:
+        prepared_df = prepare_multivariate_data(df)
+    features = prepared_df.columns.drop(target)
+    y = prepared_df[target].to_numpy(dtype=float)
+    X = np.column_stack([np.ones(len(y)), prepared_df[features].to_numpy(dtype=float)])
+    n = len(y)
     
-    current_df = prepared_df.copy()
-    model = fit_linear_model(current_df, target)
+    # Normal equations are formed once; every step only solves a sub-system of them
+    XtX = X.T @ X
+    Xty = X.T @ y
+    tss = np.sum((y - y.mean())**2)
     
-    while len(model.params) > min_features:
+    results = []
+    active = np.arange(X.shape[1])  # column 0 is the constant
+    
+    while len(active) > min_features:
+        gram = XtX[np.ix_(active, active)]
+        eigvals = np.linalg.eigvalsh(gram)
+        if eigvals[0] > eigvals[-1] * 1e-10:
+            factor = linalg.cho_factor(gram, check_finite=False)
+            beta = linalg.cho_solve(factor, Xty[active], check_finite=False)
+            gram_inv_diag = np.diag(linalg.cho_solve(factor, np.eye(len(active)), check_finite=False))
+            
+            residuals = y - X[:, active] @ beta
+            ssr = residuals @ residuals
+            df_resid = n - len(active)
+            r_squared = 1 - ssr/tss
+            # As in LinearModelResults, an exactly determined fit has no error estimate
+            if df_resid > 0:
+                adj_r_squared = 1 - (n - 1)/df_resid * (1 - r_squared)
+                t_stats = np.abs(beta[1:]) / np.sqrt(ssr/df_resid * gram_inv_diag[1:])
+            else:
+                adj_r_squared = np.nan
+                t_stats = np.full(len(active) - 1, np.nan)
+        else:
+            # Near-singular normal equations (collinear features) square the condition
+            # number of X and Cholesky can still succeed on them, so such steps are
+            # refit from the SVD of the design matrix, as statsmodels' pinv solver does
+            fit = LinearModelResults(pd.DataFrame(X[:, active]), pd.Series(y))
+            residuals = y - fit.fittedvalues.to_numpy()
+            ssr = residuals @ residuals
+            r_squared = fit.rsquared
+            adj_r_squared = fit.rsquared_adj
+            t_stats = np.abs(fit.tvalues.to_numpy()[1:])
+        
         # Record current model performance
-        metrics = get_model_metrics(model, current_df[target])
         results.append({
-            'n_features': len(model.params) - 1,  # exclude constant
-            'features': list(current_df.columns.drop(target)),
-            **metrics
+            'n_features': len(active) - 1,  # exclude constant
+            'features': list(features[active[1:] - 1]),
+            'r_squared': r_squared,
+            'adj_r_squared': adj_r_squared,
+            'rmse': np.sqrt(ssr/n),
+            'mae': np.mean(np.abs(residuals))
         })
         
-        # Weakest feature removal
-        coefs = get_model_coefficients(model)
-        weakest = coefs.index[-1]
-        current_df = current_df.drop(columns=[weakest])
-        
-        # Refit model
-        model = fit_linear_model(current_df, target)
+        # Weakest feature removal: undefined t-stats first, then the last of the smallest
+        undefined = np.flatnonzero(np.isnan(t_stats))
+        weakest = undefined[-1] if len(undefined) else len(t_stats) - 1 - np.argmin(t_stats[::-1])
+        active = np.delete(active, 1 + weakest)
     
     return pd.DataFrame(results).set_index('n_features')
 
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from QuickEDA import stats
+
+
+def _random_frame(seed: int, n_rows: int = 200) -> pd.DataFrame:
+    """Numeric columns covering the edge cases of the hand-written kernels"""
+    rng = np.random.default_rng(seed)
+    with_nan = rng.normal(size=n_rows)
+    with_nan[rng.random(n_rows) < 0.2] = np.nan
+    with_inf = rng.normal(size=n_rows)
+    with_inf[:2] = [np.inf, -np.inf]
+    return pd.DataFrame({
+        'normal': rng.normal(size=n_rows),
+        'skewed': rng.lognormal(size=n_rows),
+        'with_nan': with_nan,
+        'with_inf': with_inf,
+        'pos_inf': np.append(rng.normal(size=n_rows - 1), np.inf),
+        'neg_inf_first': np.append(-np.inf, rng.normal(size=n_rows - 1)),
+        'constant': np.full(n_rows, 3.5),
+        'all_nan': np.full(n_rows, np.nan),
+        'ties': rng.integers(0, 5, n_rows).astype(float),  # several tied modes
+        'ints': rng.integers(-50, 50, n_rows),
+        'short': np.append([1.0, 2.0], np.full(n_rows - 2, np.nan)),  # too few values for skew/kurt
+        'label': rng.choice(list('abc'), n_rows),
+    })
+
+
+def _inf_frame() -> pd.DataFrame:
+    """Short columns whose quartiles interpolate next to ±inf"""
+    columns = [[1, 2, np.inf], [1, 2, 3, 4, np.inf], [-np.inf, -np.inf, 1], [3, np.inf], [-np.inf, np.inf],
+               [1, np.inf, np.inf], [-np.inf, 1, 2, 3, 4], [1, 2, 3, np.inf]]
+    return pd.DataFrame({i: pd.Series(col, dtype=float) for i, col in enumerate(columns)})
+
+
+def _expected(df: pd.DataFrame) -> pd.DataFrame:
+    """The statistics straight from pandas' reductions"""
+    num = df.select_dtypes(np.number)
+    return pd.DataFrame({
+        'count': num.count(),
+        'unique': num.nunique(),
+        'min': num.min(),
+        '25%': num.quantile(0.25),
+        'median': num.median(),
+        '75%': num.quantile(0.75),
+        'max': num.max(),
+        'mean': num.mean(),
+        'std': num.std(),
+        'skew': num.skew(),
+        'kurt': num.kurt(),
+        'mode': [num[col].mode().iloc[0] if num[col].count() else np.nan for col in num],
+    })
+
+
+@pytest.fixture(params=['numba', 'numpy', 'polars'])
+def compute(request, monkeypatch):
+    if request.param == 'numba':
+        if not stats.HAS_NUMBA:
+            pytest.skip('numba is not installed')
+        monkeypatch.setattr(stats, 'NUMBA_MIN_VALUES', 0)
+        return stats.univariate_stats
+    if request.param == 'numpy':
+        monkeypatch.setattr(stats, 'HAS_NUMBA', False)
+        return stats.univariate_stats
+    pytest.importorskip('polars')
+    return stats.univariate_stats_pl
+
+
+@pytest.mark.parametrize('df', [
+    _random_frame(0),
+    _random_frame(1, n_rows=5),
+    _random_frame(2).iloc[:0],
+    _inf_frame(),
+], ids=['random', 'short', 'empty', 'inf'])
+def test_numeric_stats_match_pandas(compute, df):
+    expected = _expected(df)
+    result = compute(df, refresh=True).loc[expected.index, expected.columns]
+
+    pd.testing.assert_series_equal(result['count'], expected['count'], check_dtype=False)
+    pd.testing.assert_series_equal(result['unique'], expected['unique'], check_dtype=False)
+    for stat in expected.columns.drop(['count', 'unique']):
+        np.testing.assert_allclose(
+            result[stat].to_numpy(dtype=float), expected[stat].to_numpy(dtype=float),
+            rtol=1e-9, atol=1e-12, equal_nan=True, err_msg=stat
+        )